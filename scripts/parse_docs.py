@@ -11,12 +11,19 @@ Output:
     public/data/modules/Az.<Module>.json
 """
 
+import functools
 import os
 import re
 import json
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ── Category mapping ──────────────────────────────────────────────────────────
 CATEGORY_MAP = [
     ("Accounts", "Authentication"),
@@ -70,46 +77,108 @@ CATEGORY_MAP = [
 
 VERB_RE = re.compile(r'^([A-Z][a-z]+)-Az')
 
+# Precompiled patterns for the per-file hot loops
+_MD_LINK_RE = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+_MD_INLINE_RE = re.compile(r'[*_`]')
+_MODULE_INDEX_RE = re.compile(r'^Az\.[A-Za-z]+$')
+
+
+# Lowercase lookup tables derived from CATEGORY_MAP: exact matches hit the
+# dict; the ordered list is kept only for the partial-match fallback.
+_CATEGORY_EXACT = {k.lower(): v for k, v in CATEGORY_MAP}
+_CATEGORY_PARTIAL = [(k.lower(), v) for k, v in CATEGORY_MAP]
+
 
+@functools.lru_cache(maxsize=None)
 def get_category(module_name):
     """Map Az.ModuleSuffix to a category string."""
-    suffix = module_name.removeprefix("Az.")
-    for key, cat in CATEGORY_MAP:
-        if suffix.lower() == key.lower():
-            return cat
+    suffix = module_name.removeprefix("Az.").lower()
+    cat = _CATEGORY_EXACT.get(suffix)
+    if cat:
+        return cat
     # Partial match fallback
-    for key, cat in CATEGORY_MAP:
-        if key.lower() in suffix.lower():
+    for key, cat in _CATEGORY_PARTIAL:
+        if key in suffix:
             return cat
     return "Other"
 
 
 def parse_front_matter(text):
-    """Extract YAML front matter fields as a dict."""
-    m = re.match(r'^---\s*\n(.*?\n)---', text, re.DOTALL)
-    if not m:
-        return {}
-    block = m.group(1)
+    """Split YAML front matter from text. Returns (fields_dict, body)."""
+    # Front matter is always the literal first line '---', so plain string
+    # scanning beats the regex engine on the largest string in the program.
+    if not text.startswith('---\n'):
+        return {}, text
+    end = text.find('\n---', 4)
+    if end < 0:
+        return {}, text
+    block = text[4:end + 1]
     result = {}
     for line in block.splitlines():
         kv = line.split(':', 1)
         if len(kv) == 2:
             result[kv[0].strip()] = kv[1].strip().strip('"\'')
-    return result
+    return result, text[end + 4:]
+
+
+def read_md_text(filepath):
+    """Read a file as UTF-8 text with newlines normalized to '\n'."""
+    # One-shot binary read + decode: skips the TextIOWrapper that
+    # Path.read_text sets up per call. The front-matter and fence scanners
+    # expect '\n' line endings, so restore read_text's universal-newline
+    # behavior for CRLF checkouts (git autocrlf); the check is free on LF.
+    with open(filepath, 'rb') as f:
+        text = f.read().decode('utf-8', 'replace')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
 
 
 def extract_section(text, section_name):
     """Extract content under a ## SECTION_NAME heading."""
-    pattern = rf'## {re.escape(section_name)}\s*\n(.*?)(?=\n## |\Z)'
-    m = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
-    return m.group(1).strip() if m else ''
+    # Linear str.find scan: locate the heading, then the next '## ' heading.
+    # Avoids a non-greedy DOTALL regex walking the whole document per section.
+    key = f'## {section_name}'
+    i = text.find(key)
+    if i < 0:
+        # Case-insensitive fallback
+        i = text.lower().find(key.lower())
+        if i < 0:
+            return ''
+    start = text.find('\n', i) + 1
+    if start == 0:
+        return ''
+    j = text.find('\n## ', start)
+    return text[start:(j if j >= 0 else len(text))].strip()
 
 
 def extract_code_blocks(section_text, max_blocks=3):
     """Return up to max_blocks fenced code block contents."""
-    blocks = re.findall(r'```(?:powershell|ps1|posh)?\s*\n(.*?)```', section_text, re.DOTALL | re.IGNORECASE)
+    # Cheap membership gate: skip the scan entirely when there is no fence.
+    if '```' not in section_text:
+        return []
+    # The fence syntax is fixed, so a str.find scan over fence pairs beats
+    # the regex engine; non-PowerShell fences are skipped cleanly instead
+    # of confusing the match like the old DOTALL pattern could.
     cleaned = []
-    for b in blocks[:max_blocks]:
+    seen = 0
+    pos = 0
+    while seen < max_blocks:
+        i = section_text.find('```', pos)
+        if i < 0:
+            break
+        nl = section_text.find('\n', i)
+        if nl < 0:
+            break
+        lang = section_text[i + 3:nl].strip().lower()
+        j = section_text.find('```', nl + 1)
+        if j < 0:
+            break
+        pos = j + 3
+        if lang and lang not in ('powershell', 'ps1', 'posh'):
+            continue
+        seen += 1
+        b = section_text[nl + 1:j]
         lines = [l for l in b.strip().splitlines() if not l.strip().startswith('#')]
         code = '\n'.join(lines).strip()
         if code:
@@ -117,24 +186,32 @@ def extract_code_blocks(section_text, max_blocks=3):
     return cleaned
 
 
-def parse_cmdlet_doc(filepath):
+def parse_cmdlet_doc(filepath, text=None, front=None):
     """
     Parse a single cmdlet markdown file.
     Returns dict with: name, module, syntax, description, examples
     or None if this is a module-level index file.
+
+    Pass text (front matter already stripped) and front to reuse the
+    read and front-matter parse already done by the caller.
     """
-    text = Path(filepath).read_text(encoding='utf-8', errors='replace')
-    front = parse_front_matter(text)
+    if text is None:
+        text = read_md_text(filepath)
+    if front is None:
+        front, text = parse_front_matter(text)
 
     # Skip module index files (Az.ModuleName.md)
     fname = Path(filepath).stem
-    if re.match(r'^Az\.[A-Za-z]+$', fname):
+    if _MODULE_INDEX_RE.match(fname):
         return None
 
-    # Cmdlet name: prefer 'title' front-matter field, fall back to filename stem
+    # Cmdlet name: prefer 'title' front-matter field, fall back to filename stem.
+    # The verb match doubles as validation of the Verb-AzNoun shape.
     name = front.get('title') or fname
-    if not re.match(r'^[A-Z][a-z]+-Az', name):
+    vm = VERB_RE.match(name)
+    if not vm:
         return None
+    verb = vm.group(1)
 
     # Module name: prefer 'Module Name' front-matter field, fall back to Az.* parent directory
     module = front.get('Module Name', '')
@@ -144,21 +221,32 @@ def parse_cmdlet_doc(filepath):
     if not module or not module.startswith('Az.'):
         return None
 
-    synopsis_sec = extract_section(text, 'SYNOPSIS')
-    description = synopsis_sec.splitlines()[0].strip() if synopsis_sec else ''
-    # Clean up markdown
-    description = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', description)
-    description = re.sub(r'[*_`]', '', description).strip()
-
-    syntax_sec = extract_section(text, 'SYNTAX')
-    syntax_blocks = extract_code_blocks(syntax_sec, 1)
-    syntax = syntax_blocks[0] if syntax_blocks else ''
-
-    examples_sec = extract_section(text, 'EXAMPLES')
-    examples = extract_code_blocks(examples_sec, 3)
+    # Cheap prefilter: a body with no '## ' headings at all has nothing for
+    # the section scans below to find, so skip them. The entry is still
+    # emitted (with empty fields), same as for any doc missing a section.
+    description = syntax = ''
+    examples = []
+    if '## ' in text:
+        synopsis_sec = extract_section(text, 'SYNOPSIS')
+        description = synopsis_sec.splitlines()[0].strip() if synopsis_sec else ''
+        # Clean up markdown; most descriptions are plain sentences, so cheap
+        # membership checks keep the regex engine off the common path.
+        if '[' in description and '](' in description:
+            description = _MD_LINK_RE.sub(r'\1', description)
+        if '*' in description or '_' in description or '`' in description:
+            description = _MD_INLINE_RE.sub('', description)
+        description = description.strip()
+
+        syntax_sec = extract_section(text, 'SYNTAX')
+        syntax_blocks = extract_code_blocks(syntax_sec, 1)
+        syntax = syntax_blocks[0] if syntax_blocks else ''
+
+        examples_sec = extract_section(text, 'EXAMPLES')
+        examples = extract_code_blocks(examples_sec, 3)
 
     return {
         'name': name,
+        'verb': verb,
         'module': module,
         'description': description,
         'syntax': syntax,
@@ -166,6 +254,53 @@ def parse_cmdlet_doc(filepath):
     }
 
 
+def write_json(path, data, pretty=False):
+    """Write data as JSON, via orjson when available (3-10x faster encode).
+
+    Both paths honor pretty (2-space indent) so version-controlled output
+    stays deterministic regardless of whether orjson is installed.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        Path(path).write_bytes(orjson.dumps(data, option=option))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        if pretty:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        else:
+            json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
+
+
+def iter_md(root):
+    """Yield paths (str) of all .md files under root, via os.scandir."""
+    # Much faster than Path.rglob: no per-entry Path objects or extra stats.
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_md(entry.path)
+            elif entry.name.endswith('.md'):
+                yield entry.path
+
+
+def should_parse(filepath):
+    """Cheap filename-only gate: can this file contribute any output?"""
+    stem = os.path.basename(filepath)[:-3]  # strip '.md'
+    # Cmdlet docs have '-Az' in the name; module index files (Az.X.md)
+    # still feed the version map. Anything else never needs reading.
+    return '-Az' in stem or _MODULE_INDEX_RE.match(stem) is not None
+
+
+def parse_md_file(filepath):
+    """
+    Read and parse one markdown file (worker for the process pool).
+    Returns (front_matter, cmdlet_result); cmdlet_result may be None.
+    """
+    text = read_md_text(filepath)
+    front, body = parse_front_matter(text)
+    result = parse_cmdlet_doc(filepath, text=body, front=front)
+    return front, result
+
+
 def find_latest_azps_dir(docs_root):
     """Find the highest-versioned azps-* subdirectory."""
     root = Path(docs_root)
@@ -179,8 +314,8 @@ def find_latest_azps_dir(docs_root):
         raise FileNotFoundError(f'No azps-* directory found under {docs_root}')
 
     def ver_key(d):
-        parts = re.findall(r'\d+', d.name)
-        return tuple(int(x) for x in parts)
+        s = d.name.removeprefix('azps-').replace('-', '.')
+        return tuple(int(x) for x in s.split('.') if x.isdigit())
 
     return max(candidates, key=ver_key)
 
@@ -199,50 +334,68 @@ def main():
 
     print(f"Scanning {docs_root} ...")
     azps_dir = find_latest_azps_dir(docs_root)
-    version_str = re.search(r'azps-(\d+\.\d+\.\d+)', azps_dir.name)
-    version = version_str.group(1) if version_str else '0.0.0'
+    if azps_dir.name.startswith('azps-'):
+        version = azps_dir.name.removeprefix('azps-').split('-', 1)[0]
+    else:
+        version = '0.0.0'
     print(f"Found: {azps_dir.name}  (version {version})")
 
-    manifest_entries = []
+    # Manifest columns, structure-of-arrays: five parallel lists are far
+    # denser than thousands of tiny dicts; the dicts are built only when
+    # serializing, so the JSON schema is unchanged.
+    entry_names = []
+    entry_verbs = []
+    entry_modules = []
+    entry_categories = []
+    entry_examples = []
     descriptions = {}
     modules_data = {}  # module_name -> {version, cmdlets: {}}
 
-    # Find module version files
+    # Single pass over all MD files: read each file once, collect module
+    # versions from front matter, and parse cmdlet docs from Az.* directories.
+    # Each file is independent and the work is regex-bound, so fan it out to
+    # a process pool and aggregate in the main process.
+    md_files = sorted(p for p in iter_md(azps_dir) if should_parse(p))
+    if (os.cpu_count() or 1) > 1:
+        with ProcessPoolExecutor() as ex:
+            parsed = ex.map(parse_md_file, md_files, chunksize=64)
+            parsed = list(parsed)
+    else:
+        parsed = [parse_md_file(p) for p in md_files]
+
+    azps_path = str(azps_dir)
     module_version_map = {}
-    for ver_file in azps_dir.rglob('*.md'):
-        fm = parse_front_matter(ver_file.read_text(encoding='utf-8', errors='replace'))
+    parsed_by_module = {}  # module dir name -> [parsed cmdlet dicts]
+    for md_file, (fm, result) in zip(md_files, parsed):
         if 'Module Version' in fm and 'Module Name' in fm:
             mn = fm['Module Name']
             mv = fm['Module Version']
             if mn not in module_version_map:
                 module_version_map[mn] = mv
-
-    # Scan Az.* module directories
-    for mod_dir in sorted(azps_dir.iterdir()):
-        if not mod_dir.is_dir():
-            continue
-        if not mod_dir.name.startswith('Az.'):
-            continue
-        module_name = mod_dir.name
+        parent = os.path.dirname(md_file)
+        if result and os.path.dirname(parent) == azps_path:
+            parent_name = os.path.basename(parent)
+            if parent_name.startswith('Az.'):
+                parsed_by_module.setdefault(parent_name, []).append(result)
+
+    # Aggregate per module. Module, category and verb values repeat across
+    # thousands of entries but take on only ~100 distinct values, so intern
+    # them to share one str object per value.
+    for module_name in sorted(parsed_by_module):
         mod_version = module_version_map.get(module_name, '0.0.0')
-        category = get_category(module_name)
+        module_name_i = sys.intern(module_name)
+        category_i = sys.intern(get_category(module_name))
         module_cmdlets = {}
 
-        for md_file in sorted(mod_dir.glob('*.md')):
-            result = parse_cmdlet_doc(md_file)
-            if not result:
-                continue
+        for result in parsed_by_module[module_name]:
             cname = result['name']
-            vm = VERB_RE.match(cname)
-            verb = vm.group(1) if vm else 'Other'
-
-            manifest_entries.append({
-                'n': cname,
-                'v': verb,
-                'm': module_name,
-                'c': category,
-                'e': bool(result['examples']),
-            })
+            verb = sys.intern(result['verb'])
+
+            entry_names.append(cname)
+            entry_verbs.append(verb)
+            entry_modules.append(module_name_i)
+            entry_categories.append(category_i)
+            entry_examples.append(bool(result['examples']))
             if result['description']:
                 descriptions[cname] = result['description']
 
@@ -258,24 +411,28 @@ def main():
                 'cmdlets': module_cmdlets,
             }
 
-    print(f"Processed {len(manifest_entries)} cmdlets across {len(modules_data)} modules")
+    print(f"Processed {len(entry_names)} cmdlets across {len(modules_data)} modules")
 
     # Write manifest.json
-    manifest = {'v': version, 'd': manifest_entries}
-    with open(out_dir / 'manifest.json', 'w', encoding='utf-8') as f:
-        json.dump(manifest, f, separators=(',', ':'))
-    print(f"Wrote manifest.json ({len(manifest_entries)} entries)")
-
-    # Write descriptions.json
-    with open(out_dir / 'descriptions.json', 'w', encoding='utf-8') as f:
-        json.dump(descriptions, f, indent=2, ensure_ascii=False)
+    manifest = {'v': version, 'd': [
+        {'n': n, 'v': v, 'm': m, 'c': c, 'e': e}
+        for n, v, m, c, e in zip(entry_names, entry_verbs, entry_modules,
+                                 entry_categories, entry_examples)
+    ]}
+    write_json(out_dir / 'manifest.json', manifest)
+    print(f"Wrote manifest.json ({len(entry_names)} entries)")
+
+    # Write descriptions.json (pretty, for diff-ability)
+    write_json(out_dir / 'descriptions.json', descriptions, pretty=True)
     print(f"Wrote descriptions.json ({len(descriptions)} entries)")
 
-    # Write per-module JSON files
-    for mod_name, data in modules_data.items():
-        out_file = modules_dir / f'{mod_name}.json'
-        with open(out_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
+    # Write per-module JSON files; each write is independent and I/O-bound,
+    # so overlap them across threads (the GIL is released during write()).
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        list(ex.map(
+            lambda kv: write_json(modules_dir / f'{kv[0]}.json', kv[1]),
+            modules_data.items(),
+        ))
     print(f"Wrote {len(modules_data)} module JSON files to {modules_dir}")
 
 